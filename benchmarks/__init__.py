@@ -0,0 +1 @@
+"""Benchmarks for GoHighLevel MCP Server"""
@@ -0,0 +1,66 @@
+"""Construction benchmarks for form models
+
+Run with: pytest benchmarks/ --no-cov --benchmark-autosave
+Compare against the last saved run with:
+    pytest benchmarks/ --no-cov --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+from datetime import datetime, timezone
+
+from src.models.form import (
+    Form,
+    FormField,
+    FormFileUploadRequest,
+    FormSearchParams,
+    FormSubmission,
+    FormSubmitRequest,
+)
+
+SUBMITTED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_bench_form_field(benchmark):
+    """Benchmark minimal FormField construction"""
+    benchmark(lambda: FormField(id="firstName", label="First Name", type="text"))
+
+
+def test_bench_form(benchmark):
+    """Benchmark minimal Form construction"""
+    benchmark(lambda: Form(id="form_123", name="Contact Form", locationId="loc_123"))
+
+
+def test_bench_form_submission(benchmark):
+    """Benchmark minimal FormSubmission construction"""
+    benchmark(
+        lambda: FormSubmission(
+            id="sub_123",
+            formId="form_123",
+            contactId="contact_123",
+            locationId="loc_123",
+            data={"firstName": "John", "email": "john@example.com"},
+            submittedAt=SUBMITTED_AT,
+        )
+    )
+
+
+def test_bench_form_submit_request(benchmark):
+    """Benchmark minimal FormSubmitRequest construction"""
+    benchmark(lambda: FormSubmitRequest(formId="form_123", locationId="loc_123"))
+
+
+def test_bench_form_file_upload_request(benchmark):
+    """Benchmark minimal FormFileUploadRequest construction"""
+    benchmark(
+        lambda: FormFileUploadRequest(
+            contactId="contact_123",
+            locationId="loc_123",
+            fieldId="file_field_123",
+            fileName="test.pdf",
+            fileContent="VGVzdCBmaWxlIGNvbnRlbnQ=",
+        )
+    )
+
+
+def test_bench_form_search_params(benchmark):
+    """Benchmark minimal FormSearchParams construction"""
+    benchmark(lambda: FormSearchParams(locationId="loc_123"))
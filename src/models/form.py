@@ -93,6 +93,24 @@ class FormSubmissionList(BaseModel):
     count: Optional[int] = None
 
 
+def _flatten_form_data(
+    base: Dict[str, Any], custom: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Flatten submission fields into the payload expected by form submit
+
+    formId and locationId are always kept, standard fields only when set,
+    and custom fields are added directly to the data.
+    """
+    data = {
+        key: value
+        for key, value in base.items()
+        if value or key in ("formId", "locationId")
+    }
+    if custom:
+        data.update(custom)
+    return data
+
+
 class FormSubmitRequest(BaseModel):
     """Request model for form submission"""
 
@@ -112,27 +130,19 @@ class FormSubmitRequest(BaseModel):
 
     def to_form_data(self) -> Dict[str, Any]:
         """Convert to format expected by form submit endpoint"""
-        data = {"formId": self.formId, "locationId": self.locationId}
-
-        # Add standard fields if provided
-        if self.firstName:
-            data["firstName"] = self.firstName
-        if self.lastName:
-            data["lastName"] = self.lastName
-        if self.email:
-            data["email"] = self.email
-        if self.phone:
-            data["phone"] = self.phone
-        if self.company:
-            data["company"] = self.company
-        if self.message:
-            data["message"] = self.message
-
-        # Add custom fields directly to data
-        if self.customFields:
-            data.update(self.customFields)
-
-        return data
+        return _flatten_form_data(
+            {
+                "formId": self.formId,
+                "locationId": self.locationId,
+                "firstName": self.firstName,
+                "lastName": self.lastName,
+                "email": self.email,
+                "phone": self.phone,
+                "company": self.company,
+                "message": self.message,
+            },
+            self.customFields,
+        )
 
 
 class FormSubmitResponse(BaseModel):
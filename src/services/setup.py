@@ -25,18 +25,26 @@ class SetupResponse(BaseModel):
 class StandardModeSetup:
     """Handles Standard Mode setup wizard"""
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         # Use absolute path based on the module location
         base_dir = Path(__file__).parent.parent.parent  # Goes up to project root
         self.config_dir = base_dir / "config"
         self.env_file = base_dir / ".env"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Only close the client on exit if we created it
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=30.0)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
+
+    @staticmethod
+    def _is_valid_format(token: Optional[str]) -> bool:
+        """Check that a setup token has the Basic Machines prefix"""
+        return token is not None and token.startswith("bm_ghl_mcp_")
 
     def is_first_run(self) -> bool:
         """Check if this is the first time running the server"""
@@ -82,7 +90,7 @@ class StandardModeSetup:
                 with open(standard_config, "r") as f:
                     config_data = json.load(f)
                 token = config_data.get("setup_token")
-                if token and token.startswith("bm_ghl_mcp_"):
+                if self._is_valid_format(token):
                     return True, "Standard mode configured"
             except Exception:
                 pass
@@ -101,7 +109,7 @@ class StandardModeSetup:
 
     async def validate_token(self, token: str) -> SetupResponse:
         """Validate setup token with Basic Machines API"""
-        if not token or not token.startswith("bm_ghl_mcp_"):
+        if not self._is_valid_format(token):
             return SetupResponse(
                 valid=False,
                 error="invalid_format",
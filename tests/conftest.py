@@ -1,12 +1,16 @@
 """Pytest configuration and shared fixtures"""
 
+import httpx
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timedelta, timezone
 
 from src.models.auth import TokenResponse, LocationTokenResponse
 from src.models.contact import Contact
 from src.models.conversation import Conversation, Message, MessageStatus
+from src.services.setup import StandardModeSetup
+from tests.helpers import FIXED_DATE
 
 
 @pytest.fixture
@@ -60,8 +64,8 @@ def mock_contact():
         phone="+1234567890",
         tags=["test", "mock"],
         source="API Test",
-        dateAdded="2024-01-01T00:00:00Z",
-        dateUpdated="2024-01-01T00:00:00Z",
+        dateAdded=FIXED_DATE,
+        dateUpdated=FIXED_DATE,
     )
 
 
@@ -94,7 +98,7 @@ def mock_message():
         direction="outgoing",
         status=MessageStatus.SENT,
         body="Test message",
-        dateAdded="2024-01-01T00:00:00Z",
+        dateAdded=FIXED_DATE,
     )
 
 
@@ -123,3 +127,16 @@ def mock_oauth_service(
     service.token = mock_token_response
     service.location_tokens = {"mock_location_id": mock_location_token_response}
     return service
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def http_client():
+    """Shared httpx client, created once per module on the module's event loop"""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        yield client
+
+
+@pytest.fixture
+def setup_instance(http_client):
+    """StandardModeSetup that reuses the module's httpx client"""
+    return StandardModeSetup(client=http_client)
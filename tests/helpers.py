@@ -0,0 +1,46 @@
+"""Shared constants and helpers for the test suite"""
+
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+# Pre-built timestamp for fixture models, so they skip string datetime parsing
+FIXED_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Token cache expiry times that are clearly valid / clearly expired for the
+# whole run. Naive local time, matching what StandardAuthService stores and
+# compares against.
+FUTURE_ISO = (datetime.now() + timedelta(hours=1)).isoformat()
+PAST_ISO = (datetime.now() - timedelta(hours=1)).isoformat()
+
+
+def make_mock_jwt(company_id: str) -> str:
+    """Build an unsigned JWT whose payload carries the given company ID"""
+    payload = json.dumps({"authClassId": company_id}).encode()
+    encoded_payload = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    return f"header.{encoded_payload}.signature"
+
+
+class FakeResponse:
+    """Minimal stand-in for the httpx.Response fields the auth services read"""
+
+    __slots__ = ("status_code", "_json", "text")
+
+    def __init__(self, status_code, json_data, text=""):
+        self.status_code = status_code
+        self._json = json_data
+        self.text = text
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            request = httpx.Request("GET", "https://example.test")
+            raise httpx.HTTPStatusError(
+                f"HTTP {self.status_code}",
+                request=request,
+                response=httpx.Response(self.status_code, request=request),
+            )
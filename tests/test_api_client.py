@@ -2,7 +2,6 @@
 
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
-from datetime import datetime, timezone
 
 from src.api.client import GoHighLevelClient
 from src.models.contact import Contact, ContactCreate, ContactList
@@ -10,6 +9,65 @@ from src.models.conversation import MessageCreate, MessageType, Message
 from src.utils.exceptions import (
     DuplicateResourceError,
 )
+from tests.helpers import FIXED_DATE
+
+# Public methods the composed client must expose, per API area
+CONTACT_METHODS = (
+    "get_contacts",
+    "get_contact",
+    "create_contact",
+    "update_contact",
+    "delete_contact",
+    "add_contact_tags",
+    "remove_contact_tags",
+)
+CONVERSATION_METHODS = (
+    "get_conversations",
+    "get_conversation",
+    "create_conversation",
+    "get_messages",
+    "send_message",
+    "update_message_status",
+)
+OPPORTUNITY_METHODS = (
+    "get_opportunities",
+    "get_opportunity",
+    "create_opportunity",
+    "update_opportunity",
+    "delete_opportunity",
+    "update_opportunity_status",
+    "get_pipelines",
+)
+CALENDAR_METHODS = (
+    "get_appointments",
+    "get_appointment",
+    "create_appointment",
+    "update_appointment",
+    "delete_appointment",
+    "get_calendars",
+    "get_calendar",
+    "get_free_slots",
+)
+LOCATION_METHODS = (
+    "get_locations",
+    "get_location",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_contact():
+    """Create a mock contact for testing (read-only, shared by the module)"""
+    # Only read back through delegated calls, so skip validation
+    return Contact.model_construct(
+        id="test_contact_id",
+        locationId="test_location",
+        firstName="John",
+        lastName="Doe",
+        email="john@example.com",
+        phone="+1234567890",
+        dateAdded=FIXED_DATE,
+        tags=["test"],
+    )
 
 
 class TestGoHighLevelClient:
@@ -28,21 +86,6 @@ class TestGoHighLevelClient:
         """Create API client instance"""
         return GoHighLevelClient(mock_oauth_service)
 
-    @pytest.fixture
-    def mock_contact(self):
-        """Create a mock contact for testing"""
-        return Contact(
-            id="test_contact_id",
-            locationId="test_location",
-            firstName="John",
-            lastName="Doe",
-            email="john@example.com",
-            phone="+1234567890",
-            dateAdded=datetime.now(timezone.utc),
-            tags=["test"],
-        )
-
-    @pytest.mark.asyncio
     async def test_client_initialization(self, mock_oauth_service):
         """Test that client initializes specialized clients properly"""
         client = GoHighLevelClient(mock_oauth_service)
@@ -56,7 +99,6 @@ class TestGoHighLevelClient:
         # Check OAuth service is set
         assert client.oauth_service == mock_oauth_service
 
-    @pytest.mark.asyncio
     async def test_get_contacts_delegation(self, client, mock_contact):
         """Test that get_contacts properly delegates to contacts client"""
         # Mock the contacts client
@@ -83,7 +125,6 @@ class TestGoHighLevelClient:
         assert result.contacts[0].id == mock_contact.id
         assert result.total == 1
 
-    @pytest.mark.asyncio
     async def test_get_contact_delegation(self, client, mock_contact):
         """Test that get_contact properly delegates to contacts client"""
         with patch.object(
@@ -98,7 +139,6 @@ class TestGoHighLevelClient:
         assert result.id == mock_contact.id
         assert result.firstName == "John"
 
-    @pytest.mark.asyncio
     async def test_create_contact_delegation(self, client, mock_contact):
         """Test that create_contact properly delegates to contacts client"""
         contact_data = ContactCreate(
@@ -120,7 +160,6 @@ class TestGoHighLevelClient:
         assert result.id == mock_contact.id
         assert result.firstName == "John"
 
-    @pytest.mark.asyncio
     async def test_send_message_delegation(self, client):
         """Test that send_message properly delegates to conversations client"""
         message_data = MessageCreate(
@@ -132,7 +171,7 @@ class TestGoHighLevelClient:
             text="Test email",
         )
 
-        mock_message = Message(
+        mock_message = Message.model_construct(
             id="msg123",
             conversationId="conv123",
             contactId="contact123",
@@ -153,7 +192,6 @@ class TestGoHighLevelClient:
         assert result.conversationId == "conv123"
         assert result.id == "msg123"
 
-    @pytest.mark.asyncio
     async def test_error_propagation(self, client):
         """Test that errors from specialized clients are properly propagated"""
         contact_data = ContactCreate(
@@ -171,7 +209,6 @@ class TestGoHighLevelClient:
 
         assert "already exists" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_context_manager_support(self, mock_oauth_service):
         """Test that client properly supports async context manager"""
         client = GoHighLevelClient(mock_oauth_service)
@@ -223,88 +260,41 @@ class TestGoHighLevelClient:
                         mock_cal_enter.assert_called_once()
                         mock_cal_exit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_all_contact_methods_exist(self, client):
         """Test that all expected contact methods exist and are callable"""
-        contact_methods = [
-            "get_contacts",
-            "get_contact",
-            "create_contact",
-            "update_contact",
-            "delete_contact",
-            "add_contact_tags",
-            "remove_contact_tags",
-        ]
-
-        for method_name in contact_methods:
+        for method_name in CONTACT_METHODS:
             assert hasattr(client, method_name), f"Missing method: {method_name}"
             assert callable(
                 getattr(client, method_name)
             ), f"Method not callable: {method_name}"
 
-    @pytest.mark.asyncio
     async def test_all_conversation_methods_exist(self, client):
         """Test that all expected conversation methods exist and are callable"""
-        conversation_methods = [
-            "get_conversations",
-            "get_conversation",
-            "create_conversation",
-            "get_messages",
-            "send_message",
-            "update_message_status",
-        ]
-
-        for method_name in conversation_methods:
+        for method_name in CONVERSATION_METHODS:
             assert hasattr(client, method_name), f"Missing method: {method_name}"
             assert callable(
                 getattr(client, method_name)
             ), f"Method not callable: {method_name}"
 
-    @pytest.mark.asyncio
     async def test_all_opportunity_methods_exist(self, client):
         """Test that all expected opportunity methods exist and are callable"""
-        opportunity_methods = [
-            "get_opportunities",
-            "get_opportunity",
-            "create_opportunity",
-            "update_opportunity",
-            "delete_opportunity",
-            "update_opportunity_status",
-            "get_pipelines",
-        ]
-
-        for method_name in opportunity_methods:
+        for method_name in OPPORTUNITY_METHODS:
             assert hasattr(client, method_name), f"Missing method: {method_name}"
             assert callable(
                 getattr(client, method_name)
             ), f"Method not callable: {method_name}"
 
-    @pytest.mark.asyncio
     async def test_all_calendar_methods_exist(self, client):
         """Test that all expected calendar methods exist and are callable"""
-        calendar_methods = [
-            "get_appointments",
-            "get_appointment",
-            "create_appointment",
-            "update_appointment",
-            "delete_appointment",
-            "get_calendars",
-            "get_calendar",
-            "get_free_slots",
-        ]
-
-        for method_name in calendar_methods:
+        for method_name in CALENDAR_METHODS:
             assert hasattr(client, method_name), f"Missing method: {method_name}"
             assert callable(
                 getattr(client, method_name)
             ), f"Method not callable: {method_name}"
 
-    @pytest.mark.asyncio
     async def test_location_methods_exist(self, client):
         """Test that location methods exist and are callable"""
-        location_methods = ["get_locations", "get_location"]
-
-        for method_name in location_methods:
+        for method_name in LOCATION_METHODS:
             assert hasattr(client, method_name), f"Missing method: {method_name}"
             assert callable(
                 getattr(client, method_name)
@@ -322,7 +312,6 @@ class TestSpecializedClientIntegration:
         service.get_location_token = AsyncMock(return_value="location_token")
         return service
 
-    @pytest.mark.asyncio
     async def test_contacts_client_accessible(self, mock_oauth_service):
         """Test that contacts client is accessible and properly initialized"""
         from src.api.contacts import ContactsClient
@@ -332,7 +321,6 @@ class TestSpecializedClientIntegration:
         assert isinstance(client._contacts, ContactsClient)
         assert client._contacts.oauth_service == mock_oauth_service
 
-    @pytest.mark.asyncio
     async def test_conversations_client_accessible(self, mock_oauth_service):
         """Test that conversations client is accessible and properly initialized"""
         from src.api.conversations import ConversationsClient
@@ -342,7 +330,6 @@ class TestSpecializedClientIntegration:
         assert isinstance(client._conversations, ConversationsClient)
         assert client._conversations.oauth_service == mock_oauth_service
 
-    @pytest.mark.asyncio
     async def test_opportunities_client_accessible(self, mock_oauth_service):
         """Test that opportunities client is accessible and properly initialized"""
         from src.api.opportunities import OpportunitiesClient
@@ -352,7 +339,6 @@ class TestSpecializedClientIntegration:
         assert isinstance(client._opportunities, OpportunitiesClient)
         assert client._opportunities.oauth_service == mock_oauth_service
 
-    @pytest.mark.asyncio
     async def test_calendars_client_accessible(self, mock_oauth_service):
         """Test that calendars client is accessible and properly initialized"""
         from src.api.calendars import CalendarsClient
@@ -23,7 +23,6 @@ class TestAppointmentCreationFix:
         """Create a calendars client with mocked OAuth"""
         return CalendarsClient(mock_oauth_service)
 
-    @pytest.mark.asyncio
     async def test_create_appointment_minimal_response(self, calendars_client):
         """Test that create_appointment handles minimal API response correctly"""
         # Test data
@@ -82,7 +81,6 @@ class TestAppointmentCreationFix:
             assert result.notes == "Test notes"  # Should be preserved from request
             assert result.address == "https://zoom.us/j/123456"  # From response
 
-    @pytest.mark.asyncio
     async def test_create_appointment_error_response(self, calendars_client):
         """Test that create_appointment handles error responses (400) correctly"""
         # Test data
@@ -126,7 +124,6 @@ class TestAppointmentCreationFix:
                 exc_info.value
             )
 
-    @pytest.mark.asyncio
     async def test_create_appointment_with_datetime_serialization(
         self, calendars_client
     ):
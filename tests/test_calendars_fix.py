@@ -23,7 +23,6 @@ class TestCalendarsFix:
         """Create a calendars client with mocked OAuth"""
         return CalendarsClient(mock_oauth_service)
 
-    @pytest.mark.asyncio
     async def test_get_free_slots_numeric_timestamps(self, calendars_client):
         """Test that get_free_slots uses numeric timestamps and no locationId in params"""
         calendar_id = "test_calendar_id"
@@ -96,7 +95,6 @@ class TestCalendarsFix:
             assert isinstance(first_slot.startTime, datetime)
             assert first_slot.available is True
 
-    @pytest.mark.asyncio
     async def test_create_appointment_endpoint_path(self, calendars_client):
         """Test that create_appointment uses the correct endpoint path"""
         from src.models.calendar import AppointmentCreate, Appointment
@@ -169,7 +167,6 @@ class TestCalendarsFix:
             assert isinstance(result, Appointment)
             assert result.id == "new_appointment_id"
 
-    @pytest.mark.asyncio
     async def test_free_slots_response_parsing(self, calendars_client):
         """Test parsing of the actual free slots response format"""
         calendar_id = "test_calendar_id"
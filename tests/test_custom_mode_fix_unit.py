@@ -1,26 +1,23 @@
 """Unit tests for the custom mode persistence fix"""
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
-
-from src.services.setup import StandardModeSetup
 
 
 class TestCustomModeMarkerFile:
     """Test the custom mode marker file functionality"""
 
     @pytest.fixture
-    def temp_config_dir(self):
+    def temp_config_dir(self, tmp_path):
         """Create temporary config directory for testing"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        return config_dir
 
-    def test_save_custom_mode_choice_creates_marker_file(self, temp_config_dir):
+    def test_save_custom_mode_choice_creates_marker_file(
+        self, temp_config_dir, setup_instance
+    ):
         """Test that save_custom_mode_choice creates the marker file"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Initially should not exist
@@ -34,9 +31,11 @@ class TestCustomModeMarkerFile:
         assert marker_file.exists()
         assert marker_file.is_file()
 
-    def test_was_custom_mode_chosen_detects_marker_file(self, temp_config_dir):
+    def test_was_custom_mode_chosen_detects_marker_file(
+        self, temp_config_dir, setup_instance
+    ):
         """Test that was_custom_mode_chosen detects the marker file"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Initially should return False
@@ -50,9 +49,11 @@ class TestCustomModeMarkerFile:
         # Should now return True
         assert setup.was_custom_mode_chosen() is True
 
-    def test_clear_custom_mode_choice_removes_marker_file(self, temp_config_dir):
+    def test_clear_custom_mode_choice_removes_marker_file(
+        self, temp_config_dir, setup_instance
+    ):
         """Test that clear_custom_mode_choice removes the marker file"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Create marker file
@@ -67,9 +68,11 @@ class TestCustomModeMarkerFile:
         marker_file = temp_config_dir / ".custom_mode_chosen"
         assert not marker_file.exists()
 
-    def test_clear_custom_mode_choice_handles_missing_file(self, temp_config_dir):
+    def test_clear_custom_mode_choice_handles_missing_file(
+        self, temp_config_dir, setup_instance
+    ):
         """Test that clear_custom_mode_choice handles missing marker file gracefully"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Should not raise error even if marker file doesn't exist
@@ -78,34 +81,23 @@ class TestCustomModeMarkerFile:
         # Should still return False
         assert setup.was_custom_mode_chosen() is False
 
-    def test_marker_file_location_is_correct(self, temp_config_dir):
-        """Test that marker file is created in the correct location"""
-        setup = StandardModeSetup()
-        setup.config_dir = temp_config_dir
-
-        setup.save_custom_mode_choice()
-
-        expected_path = temp_config_dir / ".custom_mode_chosen"
-        assert expected_path.exists()
-
-    def test_config_directory_created_if_not_exists(self):
+    def test_config_directory_created_if_not_exists(self, tmp_path, setup_instance):
         """Test that config directory is created if it doesn't exist"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            non_existent_config = Path(temp_dir) / "config"
-            assert not non_existent_config.exists()
+        non_existent_config = tmp_path / "config"
+        assert not non_existent_config.exists()
 
-            setup = StandardModeSetup()
-            setup.config_dir = non_existent_config
+        setup = setup_instance
+        setup.config_dir = non_existent_config
 
-            setup.save_custom_mode_choice()
+        setup.save_custom_mode_choice()
 
-            # Should create the directory and the marker file
-            assert non_existent_config.exists()
-            assert (non_existent_config / ".custom_mode_chosen").exists()
+        # Should create the directory and the marker file
+        assert non_existent_config.exists()
+        assert (non_existent_config / ".custom_mode_chosen").exists()
 
-    def test_integration_workflow(self, temp_config_dir):
+    def test_integration_workflow(self, temp_config_dir, setup_instance):
         """Test the complete workflow: save -> check -> clear"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Start: no custom mode chosen
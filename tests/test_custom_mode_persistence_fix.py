@@ -1,26 +1,21 @@
 """Test the fix for custom mode persistence bug"""
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
-
-from src.services.setup import StandardModeSetup
 
 
 class TestCustomModePersistenceFix:
     """Test that the custom mode persistence fix works"""
 
     @pytest.fixture
-    def temp_config_dir(self):
+    def temp_config_dir(self, tmp_path):
         """Create temporary config directory for testing"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        return config_dir
 
-    def test_save_and_check_custom_mode_choice(self, temp_config_dir):
+    def test_save_and_check_custom_mode_choice(self, temp_config_dir, setup_instance):
         """Test saving and checking custom mode choice"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         # Initially should not be chosen
@@ -38,9 +33,9 @@ class TestCustomModePersistenceFix:
         # Should no longer be detected
         assert setup.was_custom_mode_chosen() is False
 
-    def test_marker_file_location(self, temp_config_dir):
+    def test_marker_file_location(self, temp_config_dir, setup_instance):
         """Test that marker file is created in correct location"""
-        setup = StandardModeSetup()
+        setup = setup_instance
         setup.config_dir = temp_config_dir
 
         setup.save_custom_mode_choice()
@@ -1,10 +1,8 @@
 """Test custom mode token loading at runtime"""
 
 import json
-import tempfile
 import pytest
 import asyncio
-from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta, timezone
 
@@ -16,45 +14,36 @@ class TestCustomModeTokenLoading:
     """Test that custom mode properly loads and uses saved tokens"""
 
     @pytest.fixture
-    def temp_token_file(self):
+    def temp_token_file(self, tmp_path):
         """Create a temporary token file with valid tokens"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Create a valid token that expires well in the future (beyond the 5-minute buffer)
-            token_data = {
-                "access_token": "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.test_token",
-                "refresh_token": "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.refresh_token",
-                "token_type": "Bearer",
-                "expires_at": (
-                    datetime.now(timezone.utc) + timedelta(hours=24)
-                ).isoformat(),
-                "scope": "contacts.readonly contacts.write conversations.readonly conversations.write",
-                "user_type": "Company",
-            }
-            json.dump(token_data, f, indent=2)
-            f.flush()
-            yield Path(f.name)
-
-        # Cleanup
-        Path(f.name).unlink(missing_ok=True)
+        # Create a valid token that expires well in the future (beyond the 5-minute buffer)
+        token_data = {
+            "access_token": "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.test_token",
+            "refresh_token": "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.refresh_token",
+            "token_type": "Bearer",
+            "expires_at": (
+                datetime.now(timezone.utc) + timedelta(hours=24)
+            ).isoformat(),
+            "scope": "contacts.readonly contacts.write conversations.readonly conversations.write",
+            "user_type": "Company",
+        }
+        token_file = tmp_path / "tokens.json"
+        token_file.write_text(json.dumps(token_data, indent=2))
+        return token_file
 
     @pytest.fixture
-    def temp_env_file(self):
+    def temp_env_file(self, tmp_path):
         """Create a temporary .env file for custom mode"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            env_content = """AUTH_MODE=custom
+        env_content = """AUTH_MODE=custom
 GHL_CLIENT_ID=test_client_id_123
 GHL_CLIENT_SECRET=test_secret_456
 OAUTH_REDIRECT_URI=http://localhost:8080/oauth/callback
 OAUTH_SERVER_PORT=8080
 """
-            f.write(env_content)
-            f.flush()
-            yield Path(f.name)
-
-        # Cleanup
-        Path(f.name).unlink(missing_ok=True)
+        env_file = tmp_path / ".env"
+        env_file.write_text(env_content)
+        return env_file
 
-    @pytest.mark.asyncio
     async def test_custom_mode_loads_valid_tokens(self, temp_token_file, temp_env_file):
         """Test that custom mode loads and uses valid tokens from storage"""
 
@@ -79,7 +68,6 @@ OAUTH_SERVER_PORT=8080
 
             assert token.startswith("eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.test_token")
 
-    @pytest.mark.asyncio
     async def test_custom_mode_token_missing_triggers_error(self):
         """Test that missing tokens in custom mode raises appropriate error"""
 
@@ -107,7 +95,6 @@ OAUTH_SERVER_PORT=8080
             with pytest.raises(Exception, match="No tokens available"):
                 await oauth_service.get_valid_token()
 
-    @pytest.mark.asyncio
     async def test_custom_mode_expired_token_refresh(self, temp_token_file):
         """Test that expired tokens are automatically refreshed"""
 
@@ -158,7 +145,6 @@ OAUTH_SERVER_PORT=8080
             assert token == "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9.new_valid_token"
             oauth_service.refresh_token.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_mcp_server_initialization_with_custom_tokens(self, temp_token_file):
         """Test that MCP server can initialize and use custom mode tokens"""
 
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timezone
+from types import MappingProxyType
 
 from src.models.form import (
     Form,
@@ -11,9 +11,29 @@ from src.models.form import (
     FormSubmission,
     FormSubmissionList,
     FormFileUploadRequest,
+    FormSubmitRequest,
+    _flatten_form_data,
 )
 from src.api.forms import FormsClient
 from src.services.oauth import OAuthService
+from tests.helpers import FIXED_DATE
+
+# Shared, read-only submission data so tests cannot mutate it between runs
+SUBMISSION_DATA = MappingProxyType(
+    {
+        "firstName": "John",
+        "lastName": "Doe",
+        "email": "john@example.com",
+        "custom_field_123": "Google",
+    }
+)
+
+
+def _field(id_, label, type_, required=False, options=None):
+    """Build a trusted FormField, skipping per-field validation"""
+    return FormField.model_construct(
+        id=id_, label=label, type=type_, required=required, options=options
+    )
 
 
 @pytest.fixture
@@ -31,9 +51,9 @@ def forms_client(mock_oauth_service):
     return FormsClient(mock_oauth_service)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_form():
-    """Create a sample form"""
+    """Create a sample form (read-only, shared across the module)"""
     return Form(
         id="form_123",
         name="Contact Form",
@@ -41,40 +61,33 @@ def sample_form():
         description="Test contact form",
         isActive=True,
         fields=[
-            FormField(id="firstName", label="First Name", type="text", required=True),
-            FormField(id="email", label="Email", type="email", required=True),
-            FormField(
-                id="custom_field_123",
-                label="How did you hear about us?",
-                type="dropdown",
-                required=False,
+            _field("firstName", "First Name", "text", required=True),
+            _field("email", "Email", "email", required=True),
+            _field(
+                "custom_field_123",
+                "How did you hear about us?",
+                "dropdown",
                 options=["Google", "Facebook", "Referral", "Other"],
             ),
         ],
-        createdAt=datetime.now(timezone.utc),
-        updatedAt=datetime.now(timezone.utc),
+        createdAt=FIXED_DATE,
+        updatedAt=FIXED_DATE,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_submission():
-    """Create a sample form submission"""
+    """Create a sample form submission (read-only, shared across the module)"""
     return FormSubmission(
         id="sub_123",
         formId="form_123",
         contactId="contact_123",
         locationId="loc_123",
-        data={
-            "firstName": "John",
-            "lastName": "Doe",
-            "email": "john@example.com",
-            "custom_field_123": "Google",
-        },
-        submittedAt=datetime.now(timezone.utc),
+        data=SUBMISSION_DATA,
+        submittedAt=FIXED_DATE,
     )
 
 
-@pytest.mark.asyncio
 async def test_get_forms(forms_client, sample_form):
     """Test getting forms for a location"""
     # Mock the response
@@ -102,7 +115,6 @@ async def test_get_forms(forms_client, sample_form):
         )
 
 
-@pytest.mark.asyncio
 async def test_upload_form_file(forms_client):
     """Test file upload to form field"""
     # Create file upload request
@@ -139,7 +151,6 @@ async def test_upload_form_file(forms_client):
             assert "data" in call_kwargs
 
 
-@pytest.mark.asyncio
 async def test_get_all_submissions(forms_client, sample_submission):
     """Test getting all form submissions"""
     # Mock the response
@@ -175,3 +186,45 @@ async def test_get_all_submissions(forms_client, sample_submission):
             },
             location_id="loc_123",
         )
+
+
+def test_flatten_form_data():
+    """Test flattening submission fields into form submit data"""
+    data = _flatten_form_data(
+        {
+            "formId": "form_123",
+            "locationId": "loc_123",
+            "firstName": "John",
+            "email": "john@example.com",
+            "phone": None,
+            "message": "",
+        },
+        {"custom_field_123": "Google"},
+    )
+
+    assert data == {
+        "formId": "form_123",
+        "locationId": "loc_123",
+        "firstName": "John",
+        "email": "john@example.com",
+        "custom_field_123": "Google",
+    }
+
+
+def test_form_submit_request_to_form_data():
+    """Test converting a form submit request to form data"""
+    request = FormSubmitRequest(
+        formId="form_123",
+        locationId="loc_123",
+        firstName="John",
+        lastName="Doe",
+        customFields={"custom_field_123": "Google"},
+    )
+
+    assert request.to_form_data() == {
+        "formId": "form_123",
+        "locationId": "loc_123",
+        "firstName": "John",
+        "lastName": "Doe",
+        "custom_field_123": "Google",
+    }
@@ -1,27 +1,23 @@
 """Test MCP mode startup with custom configuration"""
 
-import os
-import tempfile
 from pathlib import Path
 
-from src.services.setup import StandardModeSetup
-
 
 class TestMCPModeStartup:
     """Test that MCP mode (Claude Desktop) properly detects custom configuration"""
 
-    def test_check_auth_status_finds_env_file_in_project_root(self):
+    def test_check_auth_status_finds_env_file_in_project_root(
+        self, tmp_path, monkeypatch, setup_instance
+    ):
         """Test that check_auth_status looks for .env in the correct location"""
 
-        # Create a temporary directory structure
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Simulate project structure
-            project_root = Path(temp_dir) / "open-ghl-mcp"
-            project_root.mkdir()
+        # Simulate project structure
+        project_root = tmp_path / "open-ghl-mcp"
+        project_root.mkdir()
 
-            # Create .env file in project root
-            env_file = project_root / ".env"
-            env_content = """# GoHighLevel MCP Server - Custom Mode Configuration
+        # Create .env file in project root
+        env_file = project_root / ".env"
+        env_content = """# GoHighLevel MCP Server - Custom Mode Configuration
 AUTH_MODE=custom
 GHL_CLIENT_ID=test_client_id_123
 GHL_CLIENT_SECRET=test_secret_456
@@ -30,34 +26,28 @@ GHL_CLIENT_SECRET=test_secret_456
 OAUTH_REDIRECT_URI=http://localhost:8080/oauth/callback
 OAUTH_SERVER_PORT=8080
 """
-            env_file.write_text(env_content)
-
-            # Create config directory
-            config_dir = project_root / "config"
-            config_dir.mkdir()
+        env_file.write_text(env_content)
 
-            # Test from different working directory (simulating Claude Desktop)
-            original_cwd = os.getcwd()
-            try:
-                # Change to a different directory
-                os.chdir(temp_dir)
+        # Create config directory
+        config_dir = project_root / "config"
+        config_dir.mkdir()
 
-                # Setup should use absolute paths based on module location
-                setup = StandardModeSetup()
+        # Test from different working directory (simulating Claude Desktop)
+        monkeypatch.chdir(tmp_path)
 
-                # Mock the paths to point to our test structure
-                setup.config_dir = config_dir
-                setup.env_file = env_file
+        # Setup should use absolute paths based on module location
+        setup = setup_instance
 
-                # Check auth status
-                auth_valid, message = setup.check_auth_status()
+        # Mock the paths to point to our test structure
+        setup.config_dir = config_dir
+        setup.env_file = env_file
 
-                # Should detect custom mode configuration
-                assert auth_valid is True
-                assert message == "Custom mode configured"
+        # Check auth status
+        auth_valid, message = setup.check_auth_status()
 
-            finally:
-                os.chdir(original_cwd)
+        # Should detect custom mode configuration
+        assert auth_valid is True
+        assert message == "Custom mode configured"
 
     def test_relative_path_usage_fixed(self):
         """Test that relative path usage has been fixed in main.py and setup.py"""
@@ -85,13 +75,13 @@ OAUTH_SERVER_PORT=8080
             'Path(".env")' not in setup_content
         ), "Found relative Path('.env') usage in setup.py"
 
-    def test_env_file_path_resolution(self):
+    def test_env_file_path_resolution(self, setup_instance):
         """Test that .env file is resolved relative to project root, not CWD"""
 
         # The bug: check_auth_status uses Path(".env") which is relative to CWD
         # The fix: Should use absolute path based on project/module location
 
-        setup = StandardModeSetup()
+        setup = setup_instance
 
         # The env_file path should be absolute and based on project root
         assert setup.env_file.is_absolute()
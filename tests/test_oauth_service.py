@@ -1,12 +1,12 @@
 """Updated unit tests for OAuth service with Standard/Custom mode support"""
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock, mock_open
+from unittest.mock import patch, AsyncMock
 import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import base64
 
+from src.services import oauth as oauth_module
 from src.services.oauth import (
     OAuthService,
     OAuthSettings,
@@ -14,6 +14,9 @@ from src.services.oauth import (
     StandardAuthService,
 )
 from src.models.auth import StoredToken
+from tests.helpers import FUTURE_ISO, FakeResponse, make_mock_jwt
+
+MOCK_JWT = make_mock_jwt("company_123")
 
 
 class TestOAuthServiceStandardMode:
@@ -31,13 +34,14 @@ class TestOAuthServiceStandardMode:
     @pytest.fixture
     def oauth_service_standard(self, standard_settings):
         """Create OAuth service instance in standard mode"""
-        with patch("src.services.oauth.OAuthSettings", return_value=standard_settings):
+        with patch.object(
+            oauth_module, "OAuthSettings", return_value=standard_settings
+        ):
             service = OAuthService()
             # Mock the standard auth service
             service._standard_auth = AsyncMock(spec=StandardAuthService)
             return service
 
-    @pytest.mark.asyncio
     async def test_get_location_token_standard_mode(self, oauth_service_standard):
         """Test getting location token in standard mode"""
         location_id = "test_location"
@@ -57,7 +61,6 @@ class TestOAuthServiceStandardMode:
             location_id
         )
 
-    @pytest.mark.asyncio
     async def test_get_company_token_standard_mode(self, oauth_service_standard):
         """Test getting company token in standard mode"""
         expected_token = "company_token_123"
@@ -91,7 +94,7 @@ class TestOAuthServiceCustomMode:
     @pytest.fixture
     def oauth_service_custom(self, custom_settings, tmp_path):
         """Create OAuth service instance in custom mode"""
-        with patch("src.services.oauth.OAuthSettings", return_value=custom_settings):
+        with patch.object(oauth_module, "OAuthSettings", return_value=custom_settings):
             service = OAuthService()
             service.client = AsyncMock()  # Mock the HTTP client
             # Ensure test uses temp path
@@ -110,7 +113,6 @@ class TestOAuthServiceCustomMode:
             user_type="Location",
         )
 
-    @pytest.mark.asyncio
     async def test_load_token_no_file_custom(self, oauth_service_custom):
         """Test loading token when file doesn't exist"""
         # Ensure we're in custom mode
@@ -122,7 +124,6 @@ class TestOAuthServiceCustomMode:
         token = await oauth_service_custom.load_token()
         assert token is None
 
-    @pytest.mark.asyncio
     async def test_save_token_custom(self, oauth_service_custom, valid_stored_token):
         """Test saving token to file in custom mode"""
         await oauth_service_custom.save_token(valid_stored_token)
@@ -137,7 +138,6 @@ class TestOAuthServiceCustomMode:
 
         assert saved_data["access_token"] == valid_stored_token.access_token
 
-    @pytest.mark.asyncio
     async def test_get_valid_token_cached_custom(
         self, oauth_service_custom, valid_stored_token
     ):
@@ -150,22 +150,22 @@ class TestOAuthServiceCustomMode:
 
         assert token == valid_stored_token.access_token
 
-    @pytest.mark.asyncio
     async def test_exchange_code_for_token_custom(self, oauth_service_custom):
         """Test exchanging authorization code for token in custom mode"""
         code = "test_auth_code"
 
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "scope": "contacts.read",
-            "userType": "Location",
-        }
+        mock_response = FakeResponse(
+            200,
+            {
+                "access_token": "new_access_token",
+                "refresh_token": "new_refresh_token",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "scope": "contacts.read",
+                "userType": "Location",
+            },
+        )
 
         oauth_service_custom.client.post.return_value = mock_response
 
@@ -174,20 +174,20 @@ class TestOAuthServiceCustomMode:
         assert token_response.access_token == "new_access_token"
         assert token_response.userType == "Location"
 
-    @pytest.mark.asyncio
     async def test_refresh_token_custom(self, oauth_service_custom, valid_stored_token):
         """Test refreshing token in custom mode"""
         # Mock successful refresh response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "refreshed_access_token",
-            "refresh_token": "refreshed_refresh_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "scope": "contacts.read contacts.write",
-            "userType": "Location",
-        }
+        mock_response = FakeResponse(
+            200,
+            {
+                "access_token": "refreshed_access_token",
+                "refresh_token": "refreshed_refresh_token",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "scope": "contacts.read contacts.write",
+                "userType": "Location",
+            },
+        )
 
         oauth_service_custom.client.post.return_value = mock_response
 
@@ -213,62 +213,48 @@ class TestStandardAuthService:
         }
 
     @pytest.fixture
-    def auth_service(self, tmp_path, mock_config_data):
+    def auth_service(self, mock_config_data):
         """Create StandardAuthService with mock config"""
-        # Create mock config file
-        config_dir = tmp_path / "config"
-        config_dir.mkdir()
-        config_file = config_dir / "standard_config.json"
-
-        with open(config_file, "w") as f:
-            json.dump(mock_config_data, f)
-
         # Create mock settings
         settings = OAuthSettings(
             auth_mode=AuthMode.STANDARD, supabase_url=mock_config_data["supabase_url"]
         )
 
-        # Create service with settings
-        with patch.object(Path, "exists", return_value=True):
-            with patch(
-                "builtins.open", mock_open(read_data=json.dumps(mock_config_data))
-            ):
-                service = StandardAuthService(settings)
+        # Create service without reading the project's standard_config.json
+        with patch.object(StandardAuthService, "_load_setup_token"):
+            service = StandardAuthService(settings)
         service.client = AsyncMock()  # Mock HTTP client
-        # Override the token that was loaded from the real config file
         service.settings.supabase_access_key = mock_config_data["setup_token"]
         return service
 
-    @pytest.mark.asyncio
     async def test_get_company_token_from_cache(self, auth_service):
         """Test getting company token from cache"""
         # Set up cache with non-expired token
-        future_time = datetime.now(timezone.utc) + timedelta(hours=1)
         auth_service._company_token_cache = {
             "access_token": "cached_company_token",
-            "expires_at": future_time.isoformat(),
+            "expires_at": FUTURE_ISO,
         }
 
         token = await auth_service.get_company_token()
         assert token == "cached_company_token"
 
-    @pytest.mark.asyncio
     async def test_get_company_token_fetch_new(self, auth_service, mock_config_data):
         """Test fetching new company token"""
         # Empty cache
         auth_service._company_token_cache = None
 
         # Mock Supabase response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "new_company_token",
-            "refresh_token": "refresh_token",
-            "expires_at": (
-                datetime.now(timezone.utc) + timedelta(hours=24)
-            ).isoformat(),
-            "token_type": "Bearer",
-        }
+        mock_response = FakeResponse(
+            200,
+            {
+                "access_token": "new_company_token",
+                "refresh_token": "refresh_token",
+                "expires_at": (
+                    datetime.now(timezone.utc) + timedelta(hours=24)
+                ).isoformat(),
+                "token_type": "Bearer",
+            },
+        )
 
         auth_service.client.post.return_value = mock_response
 
@@ -286,21 +272,21 @@ class TestStandardAuthService:
             == f"Bearer {mock_config_data['setup_token']}"
         )
 
-    @pytest.mark.asyncio
     async def test_exchange_company_for_location_token(self, auth_service):
         """Test exchanging company token for location token"""
         company_token = "company_token_123"
         company_id = "comp_456"
         location_id = "loc_789"
 
-        # Mock successful exchange response
-        mock_response = Mock()
-        mock_response.status_code = 201  # GHL returns 201 for location tokens
-        mock_response.json.return_value = {
-            "access_token": "location_token_abc",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
+        # Mock successful exchange response (GHL returns 201 for location tokens)
+        mock_response = FakeResponse(
+            201,
+            {
+                "access_token": "location_token_abc",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+            },
+        )
 
         auth_service.client.post.return_value = mock_response
 
@@ -318,50 +304,41 @@ class TestStandardAuthService:
         assert call_args[1]["json"]["companyId"] == company_id
         assert call_args[1]["json"]["locationId"] == location_id
 
-    @pytest.mark.asyncio
-    async def test_get_location_token_with_jwt_parsing(self, auth_service):
+    async def test_get_location_token_with_jwt_parsing(self, auth_service, monkeypatch):
         """Test getting location token with JWT parsing and caching"""
         location_id = "test_location"
 
-        # Create mock JWT with company ID
-        payload = {"authClassId": "company_123"}
-        encoded_payload = (
-            base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
-        )
-        mock_jwt = f"header.{encoded_payload}.signature"
-
         # Mock get_company_token
-        with patch.object(auth_service, "get_company_token", return_value=mock_jwt):
-            # Mock exchange method
-            with patch.object(
-                auth_service,
-                "_exchange_company_for_location_token",
-                return_value="location_token_xyz",
-            ) as mock_exchange:
+        monkeypatch.setattr(
+            auth_service, "get_company_token", AsyncMock(return_value=MOCK_JWT)
+        )
+        # Mock exchange method
+        mock_exchange = AsyncMock(return_value="location_token_xyz")
+        monkeypatch.setattr(
+            auth_service, "_exchange_company_for_location_token", mock_exchange
+        )
 
-                token = await auth_service.get_location_token(location_id)
+        token = await auth_service.get_location_token(location_id)
 
         assert token == "location_token_xyz"
 
         # Verify exchange was called with correct parameters
-        mock_exchange.assert_called_once_with(mock_jwt, "company_123", location_id)
+        mock_exchange.assert_called_once_with(MOCK_JWT, "company_123", location_id)
 
         # Verify token was cached
         assert location_id in auth_service._location_token_cache
         cached_token = auth_service._location_token_cache[location_id]
         assert cached_token["access_token"] == "location_token_xyz"
 
-    @pytest.mark.asyncio
     async def test_get_location_token_from_cache(self, auth_service):
         """Test getting location token from cache"""
         location_id = "cached_location"
 
         # Set up cache with non-expired token
-        future_time = datetime.now(timezone.utc) + timedelta(minutes=30)
         auth_service._location_token_cache = {
             location_id: {
                 "access_token": "cached_location_token",
-                "expires_at": future_time.isoformat(),
+                "expires_at": FUTURE_ISO,
             }
         }
 
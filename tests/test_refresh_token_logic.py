@@ -44,7 +44,6 @@ class TestRefreshTokenEndpoint:
         mock_client.from_table = Mock(return_value=mock_table)
         return mock_client
 
-    @pytest.mark.asyncio
     async def test_token_refresh_when_expired(
         self, mock_expired_token, mock_fresh_token
     ):
@@ -86,7 +85,6 @@ class TestRefreshTokenEndpoint:
         assert new_token_data["access_token"] == "fresh_token_789"
         assert new_token_data["refresh_token"] == "new_refresh_token_012"
 
-    @pytest.mark.asyncio
     async def test_token_refresh_api_call_parameters(self):
         """Test that refresh token API call uses correct parameters"""
 
@@ -112,7 +110,6 @@ class TestRefreshTokenEndpoint:
         assert expected_body["user_type"] == "Company"
         assert expected_body["client_id"] == "683d23275f311ae4ccf17876-mbeko6sk"
 
-    @pytest.mark.asyncio
     async def test_token_refresh_failure_handling(self):
         """Test handling of refresh token failures"""
 
@@ -138,7 +135,6 @@ class TestRefreshTokenEndpoint:
         assert expected_error_response["error"].startswith("Token refresh failed")
         assert expected_error_response["details"] == "Invalid refresh token"
 
-    @pytest.mark.asyncio
     async def test_valid_token_not_refreshed(self):
         """Test that valid tokens are not refreshed"""
 
@@ -160,7 +156,6 @@ class TestRefreshTokenEndpoint:
         assert is_expired is False
         # Token should be returned as-is without refresh
 
-    @pytest.mark.asyncio
     async def test_database_update_after_refresh(self):
         """Test that database is updated with new token after refresh"""
 
@@ -0,0 +1,19 @@
+"""Test StandardModeSetup HTTP client ownership"""
+
+from src.services.setup import StandardModeSetup
+
+
+async def test_injected_client_left_open(setup_instance, http_client):
+    """Test that exiting the context does not close a caller-provided client"""
+    async with setup_instance:
+        pass
+
+    assert not http_client.is_closed
+
+
+async def test_owned_client_closed():
+    """Test that exiting the context closes a client the setup created"""
+    async with StandardModeSetup() as setup:
+        client = setup.client
+
+    assert client.is_closed
@@ -0,0 +1,26 @@
+"""Test setup token format validation"""
+
+import pytest
+
+from src.services.setup import StandardModeSetup
+
+
+@pytest.mark.parametrize(
+    "token", ["invalid_token", "", "bm_ghl_mcpshort", "BM_GHL_MCP_abc", None]
+)
+def test_is_valid_format_rejects_bad_tokens(token):
+    """Test that tokens without the bm_ghl_mcp_ prefix are rejected"""
+    assert StandardModeSetup._is_valid_format(token) is False
+
+
+def test_is_valid_format_accepts_prefixed_token():
+    """Test that tokens with the bm_ghl_mcp_ prefix are accepted"""
+    assert StandardModeSetup._is_valid_format("bm_ghl_mcp_test123") is True
+
+
+async def test_validate_token_invalid_format(setup_instance):
+    """Test that validate_token returns early without calling the API"""
+    response = await setup_instance.validate_token("invalid_token")
+
+    assert response.valid is False
+    assert response.error == "invalid_format"